@@ -75,6 +75,7 @@ class BinarySensor(ZhaEntity, BinarySensorEntity):
     async def async_added_to_hass(self) -> None:
         """Run when about to be added to hass."""
         await super().async_added_to_hass()
+        self._async_update_state(self._channel.cluster.get(self.SENSOR_ATTR))
         self.async_accept_signal(
             self._channel, SIGNAL_ATTR_UPDATED, self.async_set_state
         )
@@ -82,20 +83,32 @@ class BinarySensor(ZhaEntity, BinarySensorEntity):
     @property
     def is_on(self) -> bool:
         """Return True if the switch is on based on the state machine."""
-        raw_state = self._channel.cluster.get(self.SENSOR_ATTR)
-        if raw_state is None:
-            return False
-        return self.parse(raw_state)
+        return self._state
+
+    @callback
+    def _async_update_state(self, raw_state: bool | int | None) -> None:
+        """Update the cached state from a raw attribute value."""
+        self._state = raw_state is not None and self.parse(raw_state)
+
+    @callback
+    def async_state_changed(self) -> None:
+        """Entity state changed."""
+        self._async_update_state(self._channel.cluster.get(self.SENSOR_ATTR))
+        super().async_state_changed()
 
     @callback
     def async_set_state(self, attr_id, attr_name, value):
         """Set the state."""
+        if attr_name != self.SENSOR_ATTR:
+            # some channels only signal other attributes, re-read the cache
+            value = self._channel.cluster.get(self.SENSOR_ATTR)
+        self._async_update_state(value)
         self.async_write_ha_state()
 
     @staticmethod
     def parse(value: bool | int) -> bool:
         """Parse the raw attribute into a bool state."""
-        return bool(value)
+        return value != 0
 
 
 @MULTI_MATCH(channel_names=CHANNEL_ACCELEROMETER)
@@ -132,9 +145,7 @@ class BinaryInput(BinarySensor):
 @STRICT_MATCH(
     channel_names=CHANNEL_ON_OFF,
     manufacturers="IKEA of Sweden",
-    models=lambda model: isinstance(model, str)
-    and model is not None
-    and model.find("motion") != -1,
+    models=lambda model: isinstance(model, str) and "motion" in model,
 )
 @STRICT_MATCH(
     channel_names=CHANNEL_ON_OFF,
@@ -154,15 +165,26 @@ class IASZone(BinarySensor):
 
     SENSOR_ATTR = "zone_status"
 
-    @property
-    def device_class(self) -> BinarySensorDeviceClass | None:
-        """Return device class from component DEVICE_CLASSES."""
-        return CLASS_MAPPING.get(self._channel.cluster.get("zone_type"))
+    def __init__(self, unique_id, zha_device, channels, **kwargs):
+        """Initialize the ZHA IAS binary sensor."""
+        super().__init__(unique_id, zha_device, channels, **kwargs)
+        self._attr_device_class = CLASS_MAPPING.get(
+            self._channel.cluster.get("zone_type")
+        )
+
+    @callback
+    def _async_update_state(self, raw_state: bool | int | None) -> None:
+        """Update the cached state and resolve a late arriving zone type."""
+        super()._async_update_state(raw_state)
+        if self._attr_device_class is None:
+            self._attr_device_class = CLASS_MAPPING.get(
+                self._channel.cluster.get("zone_type")
+            )
 
     @staticmethod
     def parse(value: bool | int) -> bool:
         """Parse the raw attribute into a bool state."""
-        return BinarySensor.parse(value & 3)  # use only bit 0 and 1 for alarm state
+        return (value & 3) != 0  # use only bit 0 and 1 for alarm state
 
 
 @MULTI_MATCH(
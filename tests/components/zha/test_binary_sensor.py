@@ -2,11 +2,20 @@
 from unittest.mock import patch
 
 import pytest
+import zhaquirks.ikea.starkvind
 import zigpy.profiles.zha
+import zigpy.zcl.clusters.general as general
 import zigpy.zcl.clusters.measurement as measurement
 import zigpy.zcl.clusters.security as security
 
-from homeassistant.const import STATE_OFF, STATE_ON, STATE_UNAVAILABLE, Platform
+from homeassistant.components.binary_sensor import BinarySensorDeviceClass
+from homeassistant.const import (
+    ATTR_DEVICE_CLASS,
+    STATE_OFF,
+    STATE_ON,
+    STATE_UNAVAILABLE,
+    Platform,
+)
 from homeassistant.core import HomeAssistant
 
 from .common import (
@@ -14,6 +23,7 @@ from .common import (
     async_test_rejoin,
     find_entity_id,
     send_attributes_report,
+    update_attribute_cache,
 )
 from .conftest import SIG_EP_INPUT, SIG_EP_OUTPUT, SIG_EP_PROFILE, SIG_EP_TYPE
 
@@ -36,6 +46,15 @@ DEVICE_OCCUPANCY = {
     }
 }
 
+DEVICE_IKEA_AIR_PURIFIER = {
+    1: {
+        SIG_EP_PROFILE: zigpy.profiles.zha.PROFILE_ID,
+        SIG_EP_TYPE: zigpy.profiles.zha.DeviceType.COMBINED_INTERFACE,
+        SIG_EP_INPUT: [general.Basic.cluster_id, 64637],
+        SIG_EP_OUTPUT: [],
+    }
+}
+
 
 @pytest.fixture(autouse=True)
 def binary_sensor_platform_only():
@@ -44,9 +63,13 @@ def binary_sensor_platform_only():
         "homeassistant.components.zha.PLATFORMS",
         (
             Platform.BINARY_SENSOR,
+            Platform.BUTTON,
             Platform.DEVICE_TRACKER,
+            Platform.FAN,
             Platform.NUMBER,
             Platform.SELECT,
+            Platform.SENSOR,
+            Platform.SWITCH,
         ),
     ):
         yield
@@ -120,3 +143,87 @@ async def test_binary_sensor(
     # test rejoin
     await async_test_rejoin(hass, zigpy_device, [cluster], reporting)
     assert hass.states.get(entity_id).state == STATE_OFF
+
+
+async def test_iaszone_device_class(
+    hass: HomeAssistant, zigpy_device_mock, zha_device_joined_restored
+) -> None:
+    """Test ZHA IAS binary_sensor device class from the zone type."""
+    zigpy_device = zigpy_device_mock(DEVICE_IAS)
+    cluster = zigpy_device.endpoints[1].ias_zone
+    cluster.PLUGGED_ATTR_READS = {"zone_type": 0x000D}
+    update_attribute_cache(cluster)
+
+    zha_device = await zha_device_joined_restored(zigpy_device)
+    entity_id = await find_entity_id(Platform.BINARY_SENSOR, zha_device, hass)
+    assert entity_id is not None
+    assert (
+        hass.states.get(entity_id).attributes[ATTR_DEVICE_CLASS]
+        == BinarySensorDeviceClass.MOTION
+    )
+
+
+async def test_iaszone_device_class_late_zone_type(
+    hass: HomeAssistant, zigpy_device_mock, zha_device_joined_restored
+) -> None:
+    """Test ZHA IAS binary_sensor picks up a zone type cached after creation."""
+    zigpy_device = zigpy_device_mock(DEVICE_IAS)
+    zha_device = await zha_device_joined_restored(zigpy_device)
+    entity_id = await find_entity_id(Platform.BINARY_SENSOR, zha_device, hass)
+    assert entity_id is not None
+    assert ATTR_DEVICE_CLASS not in hass.states.get(entity_id).attributes
+
+    cluster = zigpy_device.endpoints[1].ias_zone
+    cluster.update_attribute(
+        security.IasZone.attributes_by_name["zone_type"].id, 0x000D
+    )
+    cluster.listener_event("cluster_command", 1, 0, [1])
+    await hass.async_block_till_done()
+    assert (
+        hass.states.get(entity_id).attributes[ATTR_DEVICE_CLASS]
+        == BinarySensorDeviceClass.MOTION
+    )
+
+
+async def test_binary_sensor_state_from_cache(
+    hass: HomeAssistant, zigpy_device_mock, zha_device_joined_restored
+) -> None:
+    """Test ZHA binary_sensor state is restored from the cluster cache."""
+    zigpy_device = zigpy_device_mock(DEVICE_IAS)
+    cluster = zigpy_device.endpoints[1].ias_zone
+    cluster.PLUGGED_ATTR_READS = {"zone_status": 1}
+    update_attribute_cache(cluster)
+
+    zha_device = await zha_device_joined_restored(zigpy_device)
+    entity_id = await find_entity_id(Platform.BINARY_SENSOR, zha_device, hass)
+    assert entity_id is not None
+    assert hass.states.get(entity_id).state == STATE_ON
+
+
+async def test_binary_sensor_cache_only_attribute(
+    hass: HomeAssistant, zigpy_device_mock, zha_device_joined_restored
+) -> None:
+    """Test ZHA binary_sensor with an attribute its channel does not signal."""
+    zigpy_device = zigpy_device_mock(
+        DEVICE_IKEA_AIR_PURIFIER,
+        manufacturer="IKEA of Sweden",
+        model="STARKVIND Air purifier",
+        quirk=zhaquirks.ikea.starkvind.IkeaSTARKVIND,
+    )
+    zha_device = await zha_device_joined_restored(zigpy_device)
+    entity_id = await find_entity_id(
+        Platform.BINARY_SENSOR, zha_device, hass, qualifier="replacefilter"
+    )
+    assert entity_id is not None
+    await async_enable_traffic(hass, [zha_device])
+    assert hass.states.get(entity_id).state == STATE_OFF
+
+    # an update of another attribute does not flip the state
+    cluster = zigpy_device.endpoints[1].ikea_airpurifier
+    await send_attributes_report(hass, cluster, {6: 1})
+    assert hass.states.get(entity_id).state == STATE_OFF
+
+    # replace_filter is only cached, the next state write picks it up
+    await send_attributes_report(hass, cluster, {1: 1})
+    await send_attributes_report(hass, cluster, {6: 0})
+    assert hass.states.get(entity_id).state == STATE_ON